@@ -2,4 +2,6 @@
 
 from .time_tools import get_current_time
 from .command_tools import execute_command
-from .gcp_tools import list_gcp_projects, create_gcp_project, HAS_GCP_TOOLS_FLAG
\ No newline at end of file
+from .gcp_tools import (
+    list_gcp_projects, create_gcp_project, invalidate_project_cache, HAS_GCP_TOOLS_FLAG
+)
\ No newline at end of file
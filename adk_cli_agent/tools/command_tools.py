@@ -3,6 +3,15 @@
 import subprocess
 import os
 
+# Seconds a command may run before it is killed
+COMMAND_TIMEOUT = 30
+
+SEPARATOR = "=" * 80
+
+def _print_block(title: str, body: str):
+    """Prints a titled, separator-framed block to stdout in a single write."""
+    print(f"\n{title}\n{SEPARATOR}\n{body}\n{SEPARATOR}\n")
+
 def execute_command(command: str) -> dict:
     """Executes a shell command and returns the result.
     
@@ -19,19 +28,18 @@ def execute_command(command: str) -> dict:
             shell=True,
             capture_output=True,
             text=True,
-            env=os.environ.copy()
+            env=os.environ.copy(),
+            timeout=COMMAND_TIMEOUT
         )
         
         # Print command output immediately and clearly
-        print("\nOutput:")
-        print("=" * 80)
         if result.stdout:
-            print(result.stdout.rstrip())
+            output = result.stdout.rstrip()
         elif result.stderr:
-            print("Error:", result.stderr.rstrip())
+            output = f"Error: {result.stderr.rstrip()}"
         else:
-            print("(No output)")
-        print("=" * 80 + "\n")
+            output = "(No output)"
+        _print_block("Output:", output)
         
         if result.returncode == 0:
             return {
@@ -45,12 +53,18 @@ def execute_command(command: str) -> dict:
                                  else f"Command failed with return code {result.returncode}")
             }
         
+    except subprocess.TimeoutExpired:
+        error_msg = f"Command timed out after {COMMAND_TIMEOUT} seconds: {command}"
+        _print_block("Error:", error_msg)
+        
+        return {
+            "status": "error",
+            "error_message": error_msg
+        }
+        
     except Exception as e:
         error_msg = f"Error executing command: {str(e)}"
-        print("\nError:")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80 + "\n")
+        _print_block("Error:", error_msg)
         
         return {
             "status": "error",
@@ -1,17 +1,305 @@
 """Google Cloud Platform (GCP) tools for ADK CLI Agent."""
 
+import functools
+import importlib.util
 import os
 import json
+import random
 import subprocess
+import threading
+import time
+from collections import OrderedDict
 
-# Check if GCP tools are available
+# Check if GCP tools are available. resourcemanager_v3 is only located here, not
+# imported: loading its protobuf descriptors is slow and most tool calls never need it.
 try:
     import google.auth
-    from google.cloud import resourcemanager_v3
-    HAS_GCP_TOOLS_FLAG = True  # Renamed to avoid conflict
+    HAS_GCP_TOOLS_FLAG = importlib.util.find_spec("google.cloud.resourcemanager_v3") is not None
 except ImportError:
     HAS_GCP_TOOLS_FLAG = False
 
+# orjson parses gcloud's JSON output several times faster when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Transient errors that are worth retrying; anything else (e.g. PermissionDenied,
+# NotFound, AlreadyExists) is raised immediately.
+# CREATE_RETRYABLE_ERRORS are rejected before the server acts on the request, so only
+# they are safe to retry for calls that must not run twice, such as create_project.
+try:
+    from google.api_core import exceptions as api_exceptions
+    CREATE_RETRYABLE_ERRORS = (
+        api_exceptions.ServiceUnavailable,
+        api_exceptions.TooManyRequests,
+    )
+    RETRYABLE_ERRORS = CREATE_RETRYABLE_ERRORS + (
+        api_exceptions.DeadlineExceeded,
+        ConnectionError,
+    )
+    # Errors after which a create may still have been accepted by the server
+    CREATE_UNCERTAIN_ERRORS = (api_exceptions.DeadlineExceeded, TimeoutError)
+    # Errors that repeat on every call until the caller's access is fixed
+    API_BREAKING_ERRORS = (
+        api_exceptions.PermissionDenied,
+        api_exceptions.Unauthenticated,
+    )
+except ImportError:
+    CREATE_RETRYABLE_ERRORS = ()
+    RETRYABLE_ERRORS = (ConnectionError,)
+    CREATE_UNCERTAIN_ERRORS = (TimeoutError,)
+    API_BREAKING_ERRORS = ()
+
+# Maximum page size accepted by the Resource Manager search API
+SEARCH_PAGE_SIZE = 500
+
+# Mock projects returned when neither the API nor the gcloud CLI is usable
+_MOCK_DEV_PROJECTS = (
+    "project-dev-1 (mock)",
+    "project-dev-2 (mock)",
+    "api-dev (mock)",
+    "frontend-dev (mock)"
+)
+_MOCK_STG_PROJECTS = (
+    "project-stg-1 (mock)",
+    "api-stg (mock)",
+    "frontend-stg (mock)"
+)
+_MOCK_PROD_PROJECTS = (
+    "project-prod-1 (mock)",
+    "api-prod (mock)",
+    "frontend-prod (mock)",
+    "backend-prod (mock)"
+)
+MOCK_PROJECTS_BY_ENV = {
+    "all": (
+        "project-mock-all-1 (mock-id-all-1)",
+        "project-mock-all-2 (mock-id-all-2)",
+        "another-dev-project-mock (mock-dev-3)",
+        "some-staging-project-mock (mock-stg-4)",
+        "critical-prod-app-mock (mock-prod-5)"
+    ),
+    "dev": _MOCK_DEV_PROJECTS,
+    "development": _MOCK_DEV_PROJECTS,
+    "stg": _MOCK_STG_PROJECTS,
+    "staging": _MOCK_STG_PROJECTS,
+    "prod": _MOCK_PROD_PROJECTS,
+    "production": _MOCK_PROD_PROJECTS,
+}
+
+# Seconds the API path is skipped after an authentication / permission failure
+API_CIRCUIT_COOLDOWN = 60.0
+# Maps operation name ('list', 'create') -> monotonic time its API circuit closes.
+# Operations are tracked separately because permissions are granted per method.
+_api_circuit_open_until = {}
+
+class ApiCircuitOpenError(Exception):
+    """Raised to skip the API approach while the circuit breaker is open."""
+
+# Seconds a successful project listing is reused. Agents often list projects several
+# times in a row (e.g. before and after creating one), and listings rarely change.
+LIST_CACHE_TTL = 15.0
+# Env filters are free-form user input, so only the most recently used ones are kept
+LIST_CACHE_MAX_ENTRIES = 32
+# Maps lower-cased env filter -> (monotonic timestamp, result dict), oldest use first.
+# Tools may be invoked from a thread pool, so access goes through _list_cache_lock.
+_list_cache = OrderedDict()
+_list_cache_lock = threading.Lock()
+
+# Fixed polling interval (seconds) used while waiting on long-running operations
+OPERATION_POLL_INTERVAL = 1.0
+
+# Set once the gcloud version probe has passed; see _gcloud_available
+_gcloud_ok = False
+
+@functools.lru_cache(maxsize=1)
+def _get_credentials():
+    """Returns the application default credentials, resolved once per process."""
+    credentials, _ = google.auth.default()
+    return credentials
+
+@functools.lru_cache(maxsize=1)
+def _get_projects_client():
+    """Returns a shared Resource Manager ProjectsClient.
+    
+    Building a client sets up its transport and auth, so the same instance is
+    reused across tool invocations.
+    """
+    from google.cloud import resourcemanager_v3
+    return resourcemanager_v3.ProjectsClient(credentials=_get_credentials())
+
+def _gcloud_available() -> bool:
+    """Checks whether the gcloud CLI can be run, remembering only a success.
+    
+    Each gcloud invocation pays a full interpreter start-up, so once the version
+    probe has passed it is not repeated before every fallback command. A failed
+    or timed-out probe is retried on the next call.
+    """
+    global _gcloud_ok
+    if _gcloud_ok:
+        return True
+    try:
+        subprocess.run(['gcloud', '--version'], capture_output=True, text=True, check=True,
+                       timeout=5)
+        _gcloud_ok = True
+        return True
+    except (FileNotFoundError, subprocess.CalledProcessError,
+            subprocess.TimeoutExpired) as gcloud_check_error:
+        print(f"gcloud CLI not found or not working: {gcloud_check_error}")
+        return False
+
+def _api_circuit_open(operation: str) -> bool:
+    """Returns True while the API approach for ``operation`` should be skipped."""
+    return time.monotonic() < _api_circuit_open_until.get(operation, 0.0)
+
+def _record_api_failure(operation: str, error: Exception):
+    """Opens the circuit breaker for ``operation`` if ``error`` means the API cannot succeed.
+    
+    Missing credentials, authentication and permission failures repeat on every
+    call, so the API round trip for that operation is skipped for
+    ``API_CIRCUIT_COOLDOWN`` seconds and callers go straight to the gcloud CLI.
+    After the cooldown the API is tried again.
+    """
+    is_credentials_error = (HAS_GCP_TOOLS_FLAG and
+                            isinstance(error, google.auth.exceptions.DefaultCredentialsError))
+    if is_credentials_error or isinstance(error, API_BREAKING_ERRORS):
+        _api_circuit_open_until[operation] = time.monotonic() + API_CIRCUIT_COOLDOWN
+
+def _cached_listing(env_lower: str):
+    """Returns a copy of a fresh cached listing for ``env_lower``, or None."""
+    with _list_cache_lock:
+        cached = _list_cache.get(env_lower)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= LIST_CACHE_TTL:
+            del _list_cache[env_lower]
+            return None
+        _list_cache.move_to_end(env_lower)
+        return dict(cached[1])
+
+def _remember_listing(env_lower: str, result: dict) -> dict:
+    """Stores a successful project listing for reuse and returns it unchanged."""
+    with _list_cache_lock:
+        _list_cache[env_lower] = (time.monotonic(), dict(result))
+        _list_cache.move_to_end(env_lower)
+        if len(_list_cache) > LIST_CACHE_MAX_ENTRIES:
+            _list_cache.popitem(last=False)
+    return result
+
+def invalidate_project_cache(env: str = None):
+    """Drops cached project listings so the next call queries GCP again.
+    
+    Args:
+        env (str, optional): Only drop the listing for this env filter. Drops all
+            cached listings when omitted.
+    """
+    with _list_cache_lock:
+        if env is None:
+            _list_cache.clear()
+        else:
+            _list_cache.pop(env.lower(), None)
+
+def _reset_caches():
+    """Drops cached listings, credentials, clients, the gcloud probe and the circuit breaker.
+    
+    Used by tests.
+    """
+    global _gcloud_ok
+    _api_circuit_open_until.clear()
+    _gcloud_ok = False
+    invalidate_project_cache()
+    _get_projects_client.cache_clear()
+    _get_credentials.cache_clear()
+
+def _retry(fn, *args, max_retries: int = 3, base: float = 1.0, cap: float = 30.0,
+           jitter: float = 0.5, retry_on: tuple = None, **kwargs):
+    """Calls ``fn`` and retries transient GCP API errors with exponential backoff.
+    
+    Args:
+        fn: The callable to invoke.
+        *args: Positional arguments passed to ``fn``.
+        max_retries (int): Number of retries after the first attempt.
+        base (float): Initial backoff delay in seconds.
+        cap (float): Maximum backoff delay in seconds (before jitter).
+        jitter (float): Maximum extra fraction of the delay added at random.
+        retry_on (tuple, optional): Exception types to retry. Defaults to
+            ``RETRYABLE_ERRORS``.
+        **kwargs: Keyword arguments passed to ``fn``.
+        
+    Returns:
+        Whatever ``fn`` returns.
+    """
+    if retry_on is None:
+        retry_on = RETRYABLE_ERRORS
+    for attempt in range(max_retries + 1):
+        try:
+            return fn(*args, **kwargs)
+        except retry_on as transient_error:
+            if attempt == max_retries:
+                raise
+            delay = min(cap, base * 2 ** attempt) * (1 + random.random() * jitter)
+            print(f"Transient GCP API error: {transient_error}, retrying in {delay:.1f}s.")
+            time.sleep(delay)
+
+def _wait_for_operation(operation, timeout: float = 120,
+                        poll_interval: float = OPERATION_POLL_INTERVAL):
+    """Waits for a long-running operation using a fixed polling interval.
+    
+    ``operation.result()`` polls with exponential backoff, which can keep sleeping
+    for several seconds after the server has already finished. Polling ``done()``
+    at a fixed interval notices completion within about one interval.
+    See google/api_core/operation.py and google/api_core/extended_operation.py.
+    
+    Args:
+        operation: The long-running operation returned by the API client.
+        timeout (float): Maximum number of seconds to wait.
+        poll_interval (float): Seconds to sleep between status refreshes.
+        
+    Returns:
+        The operation result.
+        
+    Raises:
+        TimeoutError: If the operation does not finish within ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while not operation.done():
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Operation did not complete within {timeout} seconds")
+        time.sleep(poll_interval)
+    # The operation is done, so this returns immediately (or raises the operation error)
+    return operation.result()
+
+def _project_fields(project) -> tuple:
+    """Returns (project_id, project_name) for an API Project or a gcloud JSON record.
+    
+    The display name falls back to the project ID when it is missing or empty.
+    """
+    if isinstance(project, dict):
+        project_id = project.get('projectId', '')
+        return project_id, project.get('name') or project_id
+    return project.project_id, project.display_name or project.project_id
+
+def _format_matching_projects(projects, env_lower: str) -> list:
+    """Formats the projects that match an environment filter.
+    
+    Shared by the API and gcloud CLI paths of list_gcp_projects.
+    
+    Args:
+        projects: Iterable of (project_id, project_name) pairs.
+        env_lower (str): Lower-cased environment filter; 'all' matches everything.
+        
+    Returns:
+        list: Matching projects formatted as "Name (ID)".
+    """
+    matches = []
+    for project_id, project_name in projects:
+        if (env_lower == "all" or env_lower in project_id.lower() or
+                (project_name and env_lower in project_name.lower())):
+            matches.append(f"{project_name} ({project_id})")
+    return matches
+
 def list_gcp_projects(env: str) -> dict:
     """Lists Google Cloud Platform (GCP) projects.
     
@@ -29,45 +317,50 @@ def list_gcp_projects(env: str) -> dict:
     
     env_lower = env.lower()
 
+    cached = _cached_listing(env_lower)
+    if cached is not None:
+        return cached
+
     try:
         # First approach: Try using Google Cloud Resource Manager API
         try:
             # These imports are inside try-block as per original file structure
             import google.auth 
-            from google.cloud import resourcemanager_v3
             
             if not HAS_GCP_TOOLS_FLAG:
                 raise ImportError("Google Cloud libraries not found, skipping API approach.")
+            if _api_circuit_open("list"):
+                raise ApiCircuitOpenError("API circuit breaker is open, skipping API approach.")
             
-            credentials, _ = google.auth.default()  # Can raise DefaultCredentialsError
-            client = resourcemanager_v3.ProjectsClient(credentials=credentials)
-            
-            request = resourcemanager_v3.SearchProjectsRequest()  # Searches projects accessible to the user
-            projects_list = []
+            client = _get_projects_client()  # Can raise DefaultCredentialsError
+            # Imported only once the API is actually used; loading it is slow
+            from google.cloud import resourcemanager_v3
             
-            for project in client.search_projects(request=request):
-                project_id = project.project_id
-                project_name = project.display_name if project.display_name else project_id
-                
-                if env_lower == "all":
-                    projects_list.append(f"{project_name} ({project_id})")
-                elif (env_lower in project_id.lower() or \
-                      (project_name and env_lower in project_name.lower())):
-                    projects_list.append(f"{project_name} ({project_id})")
+            # Searches projects accessible to the user; a large page size lets typical
+            # accounts be served in a single round trip.
+            request = resourcemanager_v3.SearchProjectsRequest(page_size=SEARCH_PAGE_SIZE)
+            projects_list = _format_matching_projects(
+                (_project_fields(project)
+                 for project in _retry(client.search_projects, request=request)),
+                env_lower
+            )
             
             if projects_list:
-                return {
+                return _remember_listing(env_lower, {
                     "status": "success",
                     "report": "\n".join(projects_list)
-                }
+                })
             else:
                 print(f"No projects matching '{env}' found via API, trying gcloud CLI.")
                 raise Exception(f"No projects matching '{env}' found via API") 
                 
-        except (ImportError, google.auth.exceptions.DefaultCredentialsError) as cred_api_error:
+        except (ImportError, ApiCircuitOpenError,
+                google.auth.exceptions.DefaultCredentialsError) as cred_api_error:
+            _record_api_failure("list", cred_api_error)
             print(f"Google Cloud API setup failed: {cred_api_error}, trying gcloud CLI.")
             # Fall through to CLI
         except Exception as api_error:  # Other API related errors
+            _record_api_failure("list", api_error)
             print(f"API approach failed: {api_error}, trying gcloud CLI.")
             # Fall through to CLI
             
@@ -78,14 +371,12 @@ def list_gcp_projects(env: str) -> dict:
             import json 
             import os
             
-            try:
-                subprocess.run(['gcloud', '--version'], capture_output=True, text=True, check=True, timeout=5)
-            except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as gcloud_check_error:
-                print(f"gcloud CLI not found or not working: {gcloud_check_error}, using mock data.")
+            if not _gcloud_available():
                 raise Exception("gcloud CLI not available or timed out") 
 
+            # Project only the fields used below to keep gcloud's output small
             result = subprocess.run(
-                ['gcloud', 'projects', 'list', '--format=json'],
+                ['gcloud', 'projects', 'list', '--format=json(projectId,name)'],
                 capture_output=True,
                 text=True,
                 check=True, 
@@ -94,23 +385,15 @@ def list_gcp_projects(env: str) -> dict:
             )
             
             if result.stdout:
-                projects_data = json.loads(result.stdout)
-                filtered_projects = []
-                for project in projects_data:
-                    project_id = project.get('projectId', '')
-                    project_name = project.get('name', project_id) 
-                    
-                    if env_lower == "all":
-                        filtered_projects.append(f"{project_name} ({project_id})")
-                    elif (env_lower in project_id.lower() or \
-                          (project_name and env_lower in project_name.lower())):
-                        filtered_projects.append(f"{project_name} ({project_id})")
+                projects_data = _json_loads(result.stdout)
+                projects = [_project_fields(project) for project in projects_data]
+                filtered_projects = _format_matching_projects(projects, env_lower)
                 
                 if filtered_projects:
-                    return {
+                    return _remember_listing(env_lower, {
                         "status": "success",
                         "report": "\n".join(filtered_projects)
-                    }
+                    })
                 else:
                     print(f"No projects matching '{env}' found via gcloud CLI, using mock data.")
                     raise Exception(f"No projects matching '{env}' found via gcloud CLI")
@@ -123,36 +406,7 @@ def list_gcp_projects(env: str) -> dict:
             pass 
             
         # Fall back to mock data if both API and CLI approaches fail or are skipped
-        projects_mock = []
-        if env_lower == "all":
-            projects_mock = [
-                "project-mock-all-1 (mock-id-all-1)",
-                "project-mock-all-2 (mock-id-all-2)",
-                "another-dev-project-mock (mock-dev-3)",
-                "some-staging-project-mock (mock-stg-4)",
-                "critical-prod-app-mock (mock-prod-5)"
-            ]
-            
-        elif env_lower == "dev" or env_lower == "development":
-            projects_mock = [
-                "project-dev-1 (mock)", 
-                "project-dev-2 (mock)", 
-                "api-dev (mock)", 
-                "frontend-dev (mock)"
-            ]
-        elif env_lower == "stg" or env_lower == "staging":
-            projects_mock = [
-                "project-stg-1 (mock)", 
-                "api-stg (mock)", 
-                "frontend-stg (mock)"
-            ]
-        elif env_lower == "prod" or env_lower == "production":
-            projects_mock = [
-                "project-prod-1 (mock)", 
-                "api-prod (mock)", 
-                "frontend-prod (mock)", 
-                "backend-prod (mock)"
-            ]
+        projects_mock = MOCK_PROJECTS_BY_ENV.get(env_lower, ())
         
         report_detail_prefix = "API and CLI approaches failed"
         if not HAS_GCP_TOOLS_FLAG:
@@ -195,17 +449,21 @@ def create_gcp_project(project_id: str, project_name: str = "", organization_id:
     
     effective_project_name = project_name.strip() if project_name.strip() else project_id
     
+    # A new project changes every listing, so drop cached results up front
+    invalidate_project_cache()
+    
     try:
         # First approach: Try using Google Cloud Resource Manager API
         try:
             import google.auth
-            from google.cloud import resourcemanager_v3
             
             if not HAS_GCP_TOOLS_FLAG:
                 raise ImportError("Google Cloud libraries not found, skipping API approach.")
+            if _api_circuit_open("create"):
+                raise ApiCircuitOpenError("API circuit breaker is open, skipping API approach.")
 
-            credentials, _ = google.auth.default()
-            client = resourcemanager_v3.ProjectsClient(credentials=credentials)
+            client = _get_projects_client()
+            from google.cloud import resourcemanager_v3
             
             project = resourcemanager_v3.Project()
             project.project_id = project_id
@@ -218,30 +476,42 @@ def create_gcp_project(project_id: str, project_name: str = "", organization_id:
                     formatted_org_id = f'organizations/{formatted_org_id}'
                 request_payload["parent"] = formatted_org_id
             
-            operation = client.create_project(request=request_payload)
+            # A timed-out create may still have been accepted, so only errors raised
+            # before the server acts are retried
+            operation = _retry(client.create_project, request=request_payload,
+                               retry_on=CREATE_RETRYABLE_ERRORS)
             
             print(f"Creating project {project_id} via API... This may take a minute or two.")
-            operation.result(timeout=120) # Wait for the operation to complete
+            _wait_for_operation(operation, timeout=120)
             
             return {
                 "status": "success",
                 "report": f"Project '{effective_project_name}' ({project_id}) created successfully via API."
             }
                 
-        except (ImportError, google.auth.exceptions.DefaultCredentialsError) as cred_api_error:
+        except (ImportError, ApiCircuitOpenError,
+                google.auth.exceptions.DefaultCredentialsError) as cred_api_error:
+            _record_api_failure("create", cred_api_error)
             print(f"Google Cloud API setup failed for create_project: {cred_api_error}, trying gcloud CLI.")
+        except CREATE_UNCERTAIN_ERRORS as uncertain_error:
+            # The project may already exist or still be provisioning, so creating it
+            # again through gcloud could fail or race the original request
+            return {
+                "status": "error",
+                "error_message": (f"Creating GCP project '{project_id}' did not finish in time "
+                                  f"and may still complete: {uncertain_error}. "
+                                  f"List projects before retrying.")
+            }
         except Exception as api_error:
+            _record_api_failure("create", api_error)
             print(f"API approach for create_project failed: {api_error}, trying gcloud CLI.")
             
         # Second approach: Try using gcloud CLI
         import subprocess
         import os
             
-        try:
-            subprocess.run(['gcloud', '--version'], capture_output=True, text=True, check=True, timeout=5)
-        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as gcloud_check_error:
-            print(f"gcloud CLI not found or not working for create_project: {gcloud_check_error}")
-            raise Exception(f"gcloud CLI not available or timed out: {gcloud_check_error}") # Fail if CLI not working
+        if not _gcloud_available():
+            raise Exception("gcloud CLI not available or timed out") # Fail if CLI not working
 
         cmd = ['gcloud', 'projects', 'create', project_id, 
                 f'--name={effective_project_name}', '--format=json']
@@ -271,3 +541,6 @@ def create_gcp_project(project_id: str, project_name: str = "", organization_id:
             "status": "error",
             "error_message": f"Failed to create GCP project '{project_id}': {e}"
         }
+    finally:
+        # Listings taken while the create was in flight may predate the new project
+        invalidate_project_cache()
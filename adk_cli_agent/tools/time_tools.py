@@ -1,5 +1,34 @@
 """Time-related tools for ADK CLI Agent."""
 
+import datetime
+from zoneinfo import ZoneInfo
+
+TIMEZONE_MAP = {
+    "new york": "America/New_York",
+    "paris": "Europe/Paris",
+    "jakarta": "Asia/Jakarta",
+    "tokyo": "Asia/Tokyo",
+    "london": "Europe/London",
+    "sydney": "Australia/Sydney"
+}
+
+def _format_time(moment: datetime.datetime) -> str:
+    """Formats an aware datetime like ``strftime("%H:%M:%S %Z%z")``.
+    
+    Built from integer fields directly to avoid the locale-aware C strftime path.
+    
+    Args:
+        moment (datetime.datetime): A timezone-aware datetime.
+        
+    Returns:
+        str: The time, zone abbreviation and UTC offset, e.g. "09:30:00 JST+0900".
+    """
+    offset_minutes = int(moment.utcoffset().total_seconds()) // 60
+    sign = "+" if offset_minutes >= 0 else "-"
+    offset_hours, offset_minutes = divmod(abs(offset_minutes), 60)
+    return (f"{moment.hour:02d}:{moment.minute:02d}:{moment.second:02d} "
+            f"{moment.tzname()}{sign}{offset_hours:02d}{offset_minutes:02d}")
+
 def get_current_time(city: str) -> dict:
     """Returns the current time in a specified city.
     
@@ -11,26 +40,13 @@ def get_current_time(city: str) -> dict:
     """
     print(f"--- Tool: get_current_time called with city={city} ---")
     
-    TIMEZONE_MAP = {
-        "new york": "America/New_York",
-        "paris": "Europe/Paris",
-        "jakarta": "Asia/Jakarta",
-        "tokyo": "Asia/Tokyo",
-        "london": "Europe/London",
-        "sydney": "Australia/Sydney"
-    }
-
-    import datetime
-    from zoneinfo import ZoneInfo
-    
     city_lower = city.lower()
     tz_identifier = TIMEZONE_MAP.get(city_lower)
 
     if tz_identifier:
         try:
-            tz = ZoneInfo(tz_identifier)
-            current_time = datetime.datetime.now(tz)
-            time_str = current_time.strftime("%H:%M:%S %Z%z")
+            current_time = datetime.datetime.now(ZoneInfo(tz_identifier))
+            time_str = _format_time(current_time)
             return {
                 "status": "success",
                 "report": f"The current time in {city} is {time_str}"
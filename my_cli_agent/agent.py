@@ -1,46 +1,38 @@
-import datetime
+import importlib.util
 import os
-import time
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
-import atexit
-import grpc
 import sys
-import json
 
-# Import AI providers conditionally
-try:
-    import google.generativeai as genai
-    HAS_GEMINI = True
-except ImportError:
-    HAS_GEMINI = False
-
-try:
-    import openai
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
+# Check AI provider SDKs without importing them: each takes hundreds of milliseconds
+# to load and at most one is used, so a provider imports its SDK in setup().
+def _sdk_available(module_name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except ImportError:
+        return False
 
-try:
-    import anthropic
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
+HAS_GEMINI = _sdk_available("google.generativeai")
+HAS_OPENAI = _sdk_available("openai")
+HAS_ANTHROPIC = _sdk_available("anthropic")
+genai = openai = anthropic = None
 
 # Import tools
+from .tools import command_tools, time_tools, gcp_tools
 from .tools.time_tools import get_current_time
 from .tools.command_tools import execute_command
 from .tools.gcp_tools import list_gcp_projects, create_gcp_project, delete_gcp_project, HAS_GCP_TOOLS
 
 # --- Type Definitions ---
-@dataclass
+@dataclass(slots=True)
 class ChatHistory:
     """Represents a chat message in the conversation history."""
     role: str  # 'user' or 'assistant'
     content: str
     timestamp: float
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Represents the result of a tool execution."""
     success: bool
@@ -94,24 +86,37 @@ class GeminiProvider(LLMProvider):
                 "threshold": "BLOCK_MEDIUM_AND_ABOVE"
             },
         ]
+        self._model = None
         
     def setup(self):
         """Set up Gemini with API key."""
+        global genai
         if not HAS_GEMINI:
             raise ValueError("Gemini SDK not installed. Please install with 'pip install google-generativeai'")
+        import google.generativeai as genai
             
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError("Missing GOOGLE_API_KEY environment variable.")
         genai.configure(api_key=api_key)
         
+    def _get_model(self):
+        """Return the GenerativeModel for this provider, building it on first use.
+        
+        The model ID and configuration never change after construction, so one
+        model object is shared by every request.
+        """
+        if self._model is None:
+            self._model = genai.GenerativeModel(
+                model_name=self.model_id,
+                generation_config=self.generation_config,
+                safety_settings=self.safety_settings
+            )
+        return self._model
+        
     def generate_response(self, prompt: str, conversation: List[Dict[str, str]]) -> str:
         """Generate a response using Gemini."""
-        model = genai.GenerativeModel(
-            model_name=self.model_id,
-            generation_config=self.generation_config,
-            safety_settings=self.safety_settings
-        )
+        model = self._get_model()
         
         # Convert conversation to Gemini format
         gemini_messages = []
@@ -125,11 +130,7 @@ class GeminiProvider(LLMProvider):
         
     def stream_response(self, prompt: str, conversation: List[Dict[str, str]]) -> str:
         """Stream a response using Gemini."""
-        model = genai.GenerativeModel(
-            model_name=self.model_id,
-            generation_config=self.generation_config,
-            safety_settings=self.safety_settings
-        )
+        model = self._get_model()
         
         # Convert conversation to Gemini format
         gemini_messages = []
@@ -158,8 +159,10 @@ class OpenAIProvider(LLMProvider):
         
     def setup(self):
         """Set up OpenAI with API key."""
+        global openai
         if not HAS_OPENAI:
             raise ValueError("OpenAI SDK not installed. Please install with 'pip install openai'")
+        import openai
             
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
@@ -212,8 +215,10 @@ class AnthropicProvider(LLMProvider):
         
     def setup(self):
         """Set up Anthropic with API key."""
+        global anthropic
         if not HAS_ANTHROPIC:
             raise ValueError("Anthropic SDK not installed. Please install with 'pip install anthropic'")
+        import anthropic
             
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
@@ -296,20 +301,21 @@ class Agent:
     @property
     def has_gcp_tools(self) -> bool:
         """Check if GCP tools are available."""
-        try:
-            from my_cli_agent.tools.gcp_tools import HAS_GCP_TOOLS
-            return HAS_GCP_TOOLS
-        except ImportError:
-            return False
+        return HAS_GCP_TOOLS
     
     def _load_tools(self):
         """Load available tool modules."""
-        from my_cli_agent.tools import command_tools, time_tools, gcp_tools
         self.tool_modules = {
             'command': command_tools,
             'time': time_tools,
             'gcp': gcp_tools
         }
+        # Modules that can run a command, resolved once instead of on every response
+        self.command_handlers = {
+            name: module.execute_command
+            for name, module in self.tool_modules.items()
+            if hasattr(module, 'execute_command')
+        }
     
     def execute_command(self, command: str) -> ToolResult:
         """
@@ -321,7 +327,6 @@ class Agent:
         Returns:
             ToolResult containing the command output or error
         """
-        from my_cli_agent.tools.command_tools import execute_command
         return execute_command(command)
     
     def get_time(self, city: str) -> ToolResult:
@@ -334,7 +339,6 @@ class Agent:
         Returns:
             ToolResult containing the current time or error
         """
-        from my_cli_agent.tools.time_tools import get_current_time
         return get_current_time(city)
     
     def list_gcp_projects(self, environment: str = None) -> ToolResult:
@@ -347,7 +351,6 @@ class Agent:
         Returns:
             ToolResult containing the list of projects or error
         """
-        from my_cli_agent.tools.gcp_tools import list_gcp_projects
         return list_gcp_projects(environment)
         
     def create_gcp_project(self, project_id: str, name: str = None) -> ToolResult:
@@ -361,7 +364,6 @@ class Agent:
         Returns:
             ToolResult containing the result of the operation or error information
         """
-        from my_cli_agent.tools.gcp_tools import create_gcp_project
         return create_gcp_project(project_id, name)
     
     def process_command(self, command: str) -> str:
@@ -379,10 +381,11 @@ class Agent:
             response = self.model_provider.send_message(command)
             
             # Check if we need to execute any tools
-            for tool_name, tool_module in self.tool_modules.items():
-                if tool_name in response.lower():
+            response_lower = response.lower()
+            for tool_name, tool_command in self.command_handlers.items():
+                if tool_name in response_lower:
                     # Execute relevant tool function
-                    tool_result = tool_module.execute_command(command)
+                    tool_result = tool_command(command)
                     if tool_result.success:
                         return f"Tool execution result: {tool_result.result}"
                     else:
@@ -1,46 +1,83 @@
-import datetime
+import importlib.util
 import os
+import re
 import time
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 import atexit
 import grpc
 import sys
-import json
 
-# Import AI providers conditionally
-try:
-    import google.generativeai as genai
-    HAS_GEMINI = True
-except ImportError:
-    HAS_GEMINI = False
-
-try:
-    import openai
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
+# Check AI provider SDKs without importing them: each takes hundreds of milliseconds
+# to load and at most one is used, so a provider imports its SDK in setup().
+def _sdk_available(module_name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except ImportError:
+        return False
 
-try:
-    import anthropic
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
+HAS_GEMINI = _sdk_available("google.generativeai")
+HAS_OPENAI = _sdk_available("openai")
+HAS_ANTHROPIC = _sdk_available("anthropic")
+genai = openai = anthropic = None
 
 # Import tools
 from .tools.time_tools import get_current_time
 from .tools.command_tools import execute_command
 from .tools.gcp_tools import list_gcp_projects, create_gcp_project, HAS_GCP_TOOLS
 
+# --- Direct tool routing tables ---
+# Phrases that route a prompt straight to a tool without asking the LLM
+TIME_REQUEST_PHRASES = ("what time", "current time", "time now", "time in")
+COMMAND_REQUEST_PHRASES = ("run command", "execute command", "run the command")
+GCP_LIST_REQUEST_PHRASES = ("list gcp projects", "show gcp projects", "gcp projects in")
+# Arguments recognised in routed prompts, in match priority order
+KNOWN_CITIES = ("new york", "paris", "jakarta", "tokyo", "london", "sydney")
+KNOWN_ENVS = ("dev", "development", "stg", "staging", "prod", "production")
+
+def _compile_phrases(phrases) -> re.Pattern:
+    """Compiles literal phrases into one alternation so a prompt is scanned once."""
+    return re.compile("|".join(map(re.escape, phrases)))
+
+_TIME_REQUEST_RE = _compile_phrases(TIME_REQUEST_PHRASES)
+_COMMAND_REQUEST_RE = _compile_phrases(COMMAND_REQUEST_PHRASES)
+_GCP_LIST_REQUEST_RE = _compile_phrases(GCP_LIST_REQUEST_PHRASES)
+
+def _build_tool_selection_instructions() -> str:
+    """Build the request-independent part of the tool selection prompt."""
+    tool_instructions = [
+        "If this is a request to view file contents, use execute_command with 'cat' and proper path quoting.",
+        "If this is a request to run a command, use execute_command.",
+        "If this is a request about time, use get_current_time."
+    ]
+        
+    # Add GCP projects instruction if available
+    if HAS_GCP_TOOLS:
+        tool_instructions.append("If this is a request about GCP projects, use list_gcp_projects with the environment name (dev/stg/prod).")
+        tool_instructions.append("If this is a request to create a GCP project, use create_gcp_project with the project ID and optional project name.")
+    
+    tool_instructions.extend([
+        "If none of the above tools are needed, respond with 'NO_TOOL_NEEDED' and I will handle the request directly.",
+        "Respond in the following format:",
+        "TOOL: <tool_name>",
+        "ARGS: <tool_arguments>"
+    ])
+    
+    return "\n".join(tool_instructions)
+
+# The available tools are fixed at import, so the instructions are built only once
+TOOL_SELECTION_INSTRUCTIONS = _build_tool_selection_instructions()
+
 # --- Type Definitions ---
-@dataclass
+@dataclass(slots=True)
 class ChatHistory:
     """Represents a chat message in the conversation history."""
     role: str  # 'user' or 'assistant'
     content: str
     timestamp: float
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Represents the result of a tool execution."""
     success: bool
@@ -94,24 +131,37 @@ class GeminiProvider(LLMProvider):
                 "threshold": "BLOCK_MEDIUM_AND_ABOVE"
             },
         ]
+        self._model = None
         
     def setup(self):
         """Set up Gemini with API key."""
+        global genai
         if not HAS_GEMINI:
             raise ValueError("Gemini SDK not installed. Please install with 'pip install google-generativeai'")
+        import google.generativeai as genai
             
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError("Missing GOOGLE_API_KEY environment variable.")
         genai.configure(api_key=api_key)
         
+    def _get_model(self):
+        """Return the GenerativeModel for this provider, building it on first use.
+        
+        The model ID and configuration never change after construction, so one
+        model object is shared by every request.
+        """
+        if self._model is None:
+            self._model = genai.GenerativeModel(
+                model_name=self.model_id,
+                generation_config=self.generation_config,
+                safety_settings=self.safety_settings
+            )
+        return self._model
+        
     def generate_response(self, prompt: str, conversation: List[Dict[str, str]]) -> str:
         """Generate a response using Gemini."""
-        model = genai.GenerativeModel(
-            model_name=self.model_id,
-            generation_config=self.generation_config,
-            safety_settings=self.safety_settings
-        )
+        model = self._get_model()
         
         # Convert conversation to Gemini format
         gemini_messages = []
@@ -125,11 +175,7 @@ class GeminiProvider(LLMProvider):
         
     def stream_response(self, prompt: str, conversation: List[Dict[str, str]]) -> str:
         """Stream a response using Gemini."""
-        model = genai.GenerativeModel(
-            model_name=self.model_id,
-            generation_config=self.generation_config,
-            safety_settings=self.safety_settings
-        )
+        model = self._get_model()
         
         # Convert conversation to Gemini format
         gemini_messages = []
@@ -158,8 +204,10 @@ class OpenAIProvider(LLMProvider):
         
     def setup(self):
         """Set up OpenAI with API key."""
+        global openai
         if not HAS_OPENAI:
             raise ValueError("OpenAI SDK not installed. Please install with 'pip install openai'")
+        import openai
             
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
@@ -212,8 +260,10 @@ class AnthropicProvider(LLMProvider):
         
     def setup(self):
         """Set up Anthropic with API key."""
+        global anthropic
         if not HAS_ANTHROPIC:
             raise ValueError("Anthropic SDK not installed. Please install with 'pip install anthropic'")
+        import anthropic
             
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
@@ -284,6 +334,13 @@ class AnthropicProvider(LLMProvider):
         
         return full_response
 
+# Providers in order of preference: (name, SDK installed, API key variable, class)
+PROVIDER_SPECS = (
+    ("gemini", HAS_GEMINI, "GOOGLE_API_KEY", GeminiProvider),
+    ("openai", HAS_OPENAI, "OPENAI_API_KEY", OpenAIProvider),
+    ("anthropic", HAS_ANTHROPIC, "ANTHROPIC_API_KEY", AnthropicProvider),
+)
+
 class Agent:
     """A conversational agent that can use tools to help answer questions."""
     
@@ -312,35 +369,24 @@ class Agent:
     
     def _setup_provider(self) -> LLMProvider:
         """Set up the appropriate LLM provider based on available API keys."""
-        # Check available providers
-        providers = []
+        # Read each API key variable once for both selection and error reporting
+        api_keys = {key_var: os.environ.get(key_var) for _, _, key_var, _ in PROVIDER_SPECS}
         
-        if HAS_GEMINI and os.getenv("GOOGLE_API_KEY"):
-            providers.append(("gemini", GeminiProvider()))
-            
-        if HAS_OPENAI and os.getenv("OPENAI_API_KEY"):
-            providers.append(("openai", OpenAIProvider()))
-            
-        if HAS_ANTHROPIC and os.getenv("ANTHROPIC_API_KEY"):
-            providers.append(("anthropic", AnthropicProvider()))
-        
-        if not providers:
+        # Only the first usable provider is constructed; the rest are never needed
+        for provider_name, sdk_available, key_var, provider_class in PROVIDER_SPECS:
+            if sdk_available and api_keys[key_var]:
+                break
+        else:
             # Check which providers are available but missing API keys
-            missing_keys = []
-            if HAS_GEMINI and not os.getenv("GOOGLE_API_KEY"):
-                missing_keys.append("GOOGLE_API_KEY")
-            if HAS_OPENAI and not os.getenv("OPENAI_API_KEY"):
-                missing_keys.append("OPENAI_API_KEY")
-            if HAS_ANTHROPIC and not os.getenv("ANTHROPIC_API_KEY"):
-                missing_keys.append("ANTHROPIC_API_KEY")
+            missing_keys = [key_var for _, sdk_available, key_var, _ in PROVIDER_SPECS
+                            if sdk_available and not api_keys[key_var]]
                 
             if missing_keys:
                 raise ValueError(f"Missing API key(s): {', '.join(missing_keys)}")
             else:
                 raise ValueError("No AI providers available. Please install at least one of: google-generativeai, openai, or anthropic")
         
-        # Use the first available provider
-        provider_name, provider = providers[0]
+        provider = provider_class()
         self.provider_name = provider_name
         
         # Set up the provider
@@ -410,9 +456,9 @@ class Agent:
         prompt_lower = prompt.lower()
         
         # Check for time requests
-        if any(phrase in prompt_lower for phrase in ["what time", "current time", "time now", "time in"]):
+        if _TIME_REQUEST_RE.search(prompt_lower):
             city = None
-            for known_city in ["new york", "paris", "jakarta", "tokyo", "london", "sydney"]:
+            for known_city in KNOWN_CITIES:
                 if known_city in prompt_lower:
                     city = known_city
                     break
@@ -422,7 +468,7 @@ class Agent:
             return True
             
         # Check for command execution requests
-        if any(phrase in prompt_lower for phrase in ["run command", "execute command", "run the command"]):
+        if _COMMAND_REQUEST_RE.search(prompt_lower):
             # Try to extract the command
             command = None
             if "`" in prompt:
@@ -440,9 +486,9 @@ class Agent:
                 return True
         
         # Check for GCP project listing requests
-        if HAS_GCP_TOOLS and any(phrase in prompt_lower for phrase in ["list gcp projects", "show gcp projects", "gcp projects in"]):
+        if HAS_GCP_TOOLS and _GCP_LIST_REQUEST_RE.search(prompt_lower):
             env = None
-            for known_env in ["dev", "development", "stg", "staging", "prod", "production"]:
+            for known_env in KNOWN_ENVS:
                 if known_env in prompt_lower:
                     env = known_env
                     break
@@ -456,26 +502,7 @@ class Agent:
     
     def _create_tool_selection_prompt(self, prompt: str) -> str:
         """Create a prompt to help the LLM select the appropriate tool."""
-        tool_instructions = [
-            f"Based on this user request: \"{prompt}\"",
-            "If this is a request to view file contents, use execute_command with 'cat' and proper path quoting.",
-            "If this is a request to run a command, use execute_command.",
-            "If this is a request about time, use get_current_time."
-        ]
-            
-        # Add GCP projects instruction if available
-        if HAS_GCP_TOOLS:
-            tool_instructions.append("If this is a request about GCP projects, use list_gcp_projects with the environment name (dev/stg/prod).")
-            tool_instructions.append("If this is a request to create a GCP project, use create_gcp_project with the project ID and optional project name.")
-        
-        tool_instructions.extend([
-            "If none of the above tools are needed, respond with 'NO_TOOL_NEEDED' and I will handle the request directly.",
-            "Respond in the following format:",
-            "TOOL: <tool_name>",
-            "ARGS: <tool_arguments>"
-        ])
-        
-        return "\n".join(tool_instructions)
+        return f"Based on this user request: \"{prompt}\"\n{TOOL_SELECTION_INSTRUCTIONS}"
     
     def _handle_tool_response(self, tool_response: str):
         """Handle a tool response from the LLM."""
@@ -517,10 +544,9 @@ class Agent:
     def _display_tool_result(self, result):
         """Display the result of a tool execution."""
         if result.success:
-            print("\nResult:")
-            print("=" * 50)
-            print(result.result)
-            print("=" * 50)
+            # One write for the whole framed block
+            separator = "=" * 50
+            print(f"\nResult:\n{separator}\n{result.result}\n{separator}")
         else:
             print("\nError:", result.error_message)
 
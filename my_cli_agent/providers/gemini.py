@@ -55,13 +55,13 @@ class GeminiProvider(BaseProvider):
         if not self._is_setup:
             await self.setup()
             
-        model = genai.GenerativeModel(
-            model_name=self.model_id,
-            generation_config=self.generation_config,
-            safety_settings=self.safety_settings
-        )
-        
+        # The model is only needed to open the chat session; later messages reuse it
         if self.chat_session is None:
+            model = genai.GenerativeModel(
+                model_name=self.model_id,
+                generation_config=self.generation_config,
+                safety_settings=self.safety_settings
+            )
             self.chat_session = model.start_chat()
             
         response = await self.chat_session.send_message_async(content=message)
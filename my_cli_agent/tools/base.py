@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Optional
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Represents the result of a tool execution."""
     success: bool
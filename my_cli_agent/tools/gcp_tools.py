@@ -1,4 +1,5 @@
 """GCP tools for project management."""
+import functools
 import subprocess
 import json
 from typing import Optional, List, Dict, Any
@@ -14,12 +15,51 @@ try:
 except ImportError:
     HAS_GCP_TOOLS = False
 
+# Projects requested per search page (the API's upper bound), so most accounts
+# are listed in one request
+SEARCH_PAGE_SIZE = 500
+
+# Seconds to wait for a gcloud CLI fallback before giving up
+GCLOUD_TIMEOUT = 30
+
 # Initialize the client
 try:
     client = resource_manager.Client()
 except Exception:
     client = None
 
+@functools.lru_cache(maxsize=1)
+def _get_projects_client() -> "resourcemanager_v3.ProjectsClient":
+    """Returns the ProjectsClient shared by all tool calls.
+
+    Returns:
+        resourcemanager_v3.ProjectsClient: Client built from the default credentials
+    """
+    credentials, _ = google.auth.default()
+    return resourcemanager_v3.ProjectsClient(credentials=credentials)
+
+# Mock projects for testing with clear environment indicators
+MOCK_PROJECTS = (
+    "Mock Dev Project (mock-dev-123)",
+    "Mock Staging Project (mock-stg-456)",
+    "Mock Production Project (mock-prod-789)",
+    "Mock Shared Services (mock-shared-001)",
+    "Mock Monitoring (mock-monitoring-001)",
+    "Mock Development (mock-dev-124)",
+    "Mock Staging 2 (mock-staging-457)",
+    "Mock Production 2 (mock-production-790)"
+)
+# (project, lower-cased project) pairs so matching does not re-lowercase every call
+_MOCK_PROJECTS_LOWER = tuple((project, project.lower()) for project in MOCK_PROJECTS)
+
+# Map environment to keywords used to match mock projects
+MOCK_ENV_KEYWORDS: Dict[str, List[str]] = {
+    'dev': ['-dev-', 'development'],
+    'stg': ['-stg-', '-staging'],
+    'prod': ['-prod-', '-production'],
+    'invalid': ['invalid']  # Special case for testing invalid env
+}
+
 def get_mock_projects(env: str) -> List[str]:
     """Returns projects for a given environment.
 
@@ -29,36 +69,21 @@ def get_mock_projects(env: str) -> List[str]:
     Returns:
         List[str]: List of project strings in format "Name (ID)"
     """
-    # Mock projects for testing with clear environment indicators
-    mock_projects = [
-        "Mock Dev Project (mock-dev-123)",
-        "Mock Staging Project (mock-stg-456)",
-        "Mock Production Project (mock-prod-789)",
-        "Mock Shared Services (mock-shared-001)",
-        "Mock Monitoring (mock-monitoring-001)",
-        "Mock Development (mock-dev-124)",
-        "Mock Staging 2 (mock-staging-457)",
-        "Mock Production 2 (mock-production-790)"
-    ]
-    
     env = env.lower()
     if env == 'all':
-        return mock_projects
-            
-    # Map environment to keywords
-    env_keywords = {
-        'dev': ['-dev-', 'development'],
-        'stg': ['-stg-', '-staging'],
-        'prod': ['-prod-', '-production'],
-        'invalid': ['invalid']  # Special case for testing invalid env
-    }
+        return list(MOCK_PROJECTS)
             
-    keywords = env_keywords.get(env, [env])
-    filtered = [p for p in mock_projects if any(kw in p.lower() for kw in keywords)]
-        
     # Special case for testing invalid environment
     if env == 'invalid':
         return [f"No projects matching environment: {env}"]
+
+    keywords = MOCK_ENV_KEYWORDS.get(env, [env])
+    filtered = []
+    for project, project_lower in _MOCK_PROJECTS_LOWER:
+        for keyword in keywords:
+            if keyword in project_lower:
+                filtered.append(project)
+                break
             
     return filtered if filtered else [f"No projects found matching environment: {env}"]
 
@@ -118,21 +143,23 @@ def list_gcp_projects(env: str = 'all') -> ToolResult:
     try:
         # Try using the Resource Manager API first
         try:
-            credentials, _ = google.auth.default()
-            client_v3 = resourcemanager_v3.ProjectsClient(credentials=credentials)
+            client_v3 = _get_projects_client()
             
-            # List all projects
-            projects = list(client_v3.search_projects())
+            # Stream projects straight from the pager; the maximum page size keeps
+            # most accounts to a single round trip
+            request = resourcemanager_v3.SearchProjectsRequest(page_size=SEARCH_PAGE_SIZE)
             
-            # Filter projects by environment
+            # Filter projects by environment; the ID markers are built once, not per project
+            match_all = env == 'all'
+            env_suffix, env_prefix = f'-{env}', f'{env}-'
             filtered_projects = []
-            for project in projects:
-                project_name = project.display_name or project.project_id
-                project_str = f"{project_name} ({project.project_id})"
+            for project in client_v3.search_projects(request=request):
+                project_id = project.project_id
                 
                 # Simple environment filtering based on project ID
-                if env == 'all' or f'-{env}' in project.project_id or f'{env}-' in project.project_id:
-                    filtered_projects.append(project_str)
+                if match_all or env_suffix in project_id or env_prefix in project_id:
+                    project_name = project.display_name or project_id
+                    filtered_projects.append(f"{project_name} ({project_id})")
             
             if not filtered_projects:
                 return ToolResult(
@@ -155,26 +182,23 @@ def list_gcp_projects(env: str = 'all') -> ToolResult:
                     cmd,
                     capture_output=True,
                     text=True,
-                    check=True
+                    check=True,
+                    timeout=GCLOUD_TIMEOUT
                 )
                 
-                # Parse the output
+                # Parse the output and filter by environment in a single pass
+                env_markers = (f'-{env}', f'{env}-', f' {env} ')
                 projects = []
-                for line in result.stdout.strip().split('\n'):
-                    if not line.strip():
+                for line in result.stdout.split('\n'):
+                    parts = line.split()
+                    if len(parts) < 2:
                         continue
-                    parts = line.strip().split()
-                    if len(parts) >= 2:
-                        name = ' '.join(parts[:-1])
-                        project_id = parts[-1]
-                        projects.append(f"{name} ({project_id})")
-                
-                # Filter by environment if needed
-                if env != 'all':
-                    projects = [p for p in projects if 
-                              f'-{env}' in p.lower() or 
-                              f'{env}-' in p.lower() or
-                              f' {env} ' in p.lower()]
+                    project = f"{' '.join(parts[:-1])} ({parts[-1]})"
+                    if env != 'all':
+                        project_lower = project.lower()
+                        if not any(marker in project_lower for marker in env_markers):
+                            continue
+                    projects.append(project)
                 
                 if not projects:
                     return ToolResult(
@@ -195,6 +219,12 @@ def list_gcp_projects(env: str = 'all') -> ToolResult:
                     result=f"Failed to list projects via gcloud CLI: {cli_error.stderr}",
                     error_message=str(cli_error)
                 )
+            except subprocess.TimeoutExpired as timeout_error:
+                return ToolResult(
+                    success=False,
+                    result=f"gcloud CLI timed out after {GCLOUD_TIMEOUT} seconds listing projects",
+                    error_message=str(timeout_error)
+                )
         
     except Exception as e:
         return ToolResult(
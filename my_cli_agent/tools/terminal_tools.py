@@ -1,10 +1,23 @@
 import subprocess
 import os
+import re
 import shlex
 import sys
 from subprocess import TimeoutExpired
 from .base import ToolResult
 
+# Potentially dangerous command fragments that are never executed
+DANGEROUS_COMMANDS = (
+    "rm -rf /", "rm -rf /*", "rm -rf ~", "rm -rf ~/", "rm -rf ~/*",
+    "mkfs", "dd if=/dev/zero", ":(){ :|:& };:", "> /dev/sda",
+    "chmod -R 777 /", "mv ~ /dev/null"
+)
+
+# Single alternation so each command is scanned once instead of once per fragment
+_DANGEROUS_COMMAND_RE = re.compile(
+    "|".join(re.escape(fragment) for fragment in DANGEROUS_COMMANDS)
+)
+
 def execute_command(command: str) -> ToolResult:
     """
     Executes a shell command and returns the result.
@@ -22,25 +35,18 @@ def execute_command(command: str) -> ToolResult:
     print(f"\nExecuting command: {command}")
     
     # Check for potentially dangerous commands
-    dangerous_commands = [
-        "rm -rf /", "rm -rf /*", "rm -rf ~", "rm -rf ~/", "rm -rf ~/*",
-        "mkfs", "dd if=/dev/zero", ":(){ :|:& };:", "> /dev/sda",
-        "chmod -R 777 /", "mv ~ /dev/null"
-    ]
-    
-    for dangerous in dangerous_commands:
-        if dangerous in command:
-            error_msg = f"Refusing to execute potentially dangerous command: {command}"
-            print(f"\nSecurity Warning:\n{'-' * 80}\n{error_msg}\n{'-' * 80}\n")
-            return ToolResult(
-                success=False,
-                error_message=error_msg,
-                result={
-                    'stdout': '',
-                    'stderr': error_msg,
-                    'return_code': -1
-                }
-            )
+    if _DANGEROUS_COMMAND_RE.search(command):
+        error_msg = f"Refusing to execute potentially dangerous command: {command}"
+        print(f"\nSecurity Warning:\n{'-' * 80}\n{error_msg}\n{'-' * 80}\n")
+        return ToolResult(
+            success=False,
+            error_message=error_msg,
+            result={
+                'stdout': '',
+                'stderr': error_msg,
+                'return_code': -1
+            }
+        )
     
     try:
         # Set a timeout to prevent hanging commands
@@ -63,16 +69,18 @@ def execute_command(command: str) -> ToolResult:
             stdout = stdout[:max_output_length] + "\n... (output truncated, too long)"
         
         # Print command output immediately and clearly
-        print(f"\nCommand completed with return code: {result.returncode}")
-        print("=" * 80)
+        # Assemble the whole block first so it reaches stdout in a single write
+        separator = "=" * 80
+        lines = [f"\nCommand completed with return code: {result.returncode}", separator]
         if stdout:
-            print(stdout)
+            lines.append(stdout)
         if stderr:
-            print("Error output:")
-            print(stderr)
+            lines.append("Error output:")
+            lines.append(stderr)
         if not stdout and not stderr:
-            print("(No output)")
-        print("=" * 80 + "\n")
+            lines.append("(No output)")
+        lines.append(separator + "\n")
+        print("\n".join(lines))
         
         # Return a more structured result
         return ToolResult(
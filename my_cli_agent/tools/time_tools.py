@@ -15,6 +15,9 @@ TIMEZONE_MAP: Dict[str, str] = {
     "utc": "UTC"
 }
 
+# Listed in the error for unsupported cities; the map is fixed, so join it once
+_AVAILABLE_CITIES = ", ".join(sorted(TIMEZONE_MAP))
+
 def get_current_time(city: str = "") -> ToolResult:
     """
     Get the current time for a city.
@@ -47,10 +50,9 @@ def get_time_for_city(city: str) -> ToolResult:
     tz_identifier = TIMEZONE_MAP.get(city_lower)
     
     if not tz_identifier:
-        available_cities = ", ".join(sorted(TIMEZONE_MAP.keys()))
         return ToolResult(
             success=False,
-            result=f"Invalid city: {city}. Available cities: {available_cities}"
+            result=f"Invalid city: {city}. Available cities: {_AVAILABLE_CITIES}"
         )
     
     try:
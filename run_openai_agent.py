@@ -1,10 +1,21 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
 import openai
 import subprocess
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any
+
+# Phrases in a model reply that ask for a tool, matched case-insensitively in one scan
+TIME_TOOL_RE = re.compile(re.escape("use the get_current_time tool"), re.IGNORECASE)
+COMMAND_TOOL_RE = re.compile(
+    "|".join(map(re.escape, ("use the execute_command tool", "run the command"))),
+    re.IGNORECASE
+)
+
+# Seconds a shell command run by execute_command may take before it is killed
+COMMAND_TIMEOUT = 30
 
 def get_current_time(city: str = "") -> Dict[str, Any]:
     """Get the current time, optionally for a specific city."""
@@ -22,7 +33,8 @@ def execute_command(command: str) -> Dict[str, Any]:
             command, 
             shell=True, 
             capture_output=True, 
-            text=True
+            text=True,
+            timeout=COMMAND_TIMEOUT
         )
         
         if result.returncode == 0:
@@ -35,12 +47,25 @@ def execute_command(command: str) -> Dict[str, Any]:
                 "success": False,
                 "error_message": result.stderr
             }
+    except subprocess.TimeoutExpired:
+        return {
+            "success": False,
+            "error_message": f"Command timed out after {COMMAND_TIMEOUT} seconds: {command}"
+        }
     except Exception as e:
         return {
             "success": False,
             "error_message": str(e)
         }
 
+def print_tool_result(result: Dict[str, Any]):
+    """Print a tool result as a single framed block, or its error message."""
+    if result["success"]:
+        separator = "=" * 50
+        print(f"\nResult:\n{separator}\n{result['result']}\n{separator}")
+    else:
+        print("\nError:", result["error_message"])
+
 def main():
     """Main function to run the OpenAI CLI Agent."""
     # Check for OpenAI API key
@@ -114,17 +139,11 @@ def main():
             conversation.append({"role": "assistant", "content": full_response})
             
             # Check if the response contains tool instructions
-            if "use the get_current_time tool" in full_response.lower():
+            if TIME_TOOL_RE.search(full_response):
                 result = get_current_time()
-                if result["success"]:
-                    print("\nResult:")
-                    print("=" * 50)
-                    print(result["result"])
-                    print("=" * 50)
-                else:
-                    print("\nError:", result["error_message"])
+                print_tool_result(result)
                     
-            elif "use the execute_command tool" in full_response.lower() or "run the command" in full_response.lower():
+            elif COMMAND_TOOL_RE.search(full_response):
                 # Try to extract the command
                 command = None
                 if "`" in full_response:
@@ -136,13 +155,7 @@ def main():
                 if command:
                     print(f"\nExecuting command: {command}")
                     result = execute_command(command)
-                    if result["success"]:
-                        print("\nResult:")
-                        print("=" * 50)
-                        print(result["result"])
-                        print("=" * 50)
-                    else:
-                        print("\nError:", result["error_message"])
+                    print_tool_result(result)
                 else:
                     print("\nCould not determine which command to execute.")
             
@@ -29,7 +29,8 @@ class TestCommandTools:
             shell=True,
             capture_output=True,
             text=True,
-            env=os.environ.copy()
+            env=os.environ.copy(),
+            timeout=30
         )
 
     @patch('subprocess.run')
@@ -63,6 +64,16 @@ class TestCommandTools:
         assert "Error executing command" in result["error_message"]
         assert "Command not found" in result["error_message"]
 
+    @patch('subprocess.run')
+    def test_execute_command_timeout(self, mock_run):
+        """Test command execution that exceeds the timeout."""
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd="sleep 60", timeout=30)
+
+        result = execute_command("sleep 60")
+
+        assert result["status"] == "error"
+        assert "timed out" in result["error_message"]
+
     @patch('subprocess.run')
     def test_execute_command_no_output(self, mock_run):
         """Test command execution with no output."""
@@ -4,17 +4,14 @@ from unittest.mock import patch, MagicMock, ANY
 from google.api_core import operation
 import subprocess
 import json
-import sys
-import os
-
-# Add the project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
 
 # Import the functions we're testing
 from adk_cli_agent.tools.gcp_tools import (
     list_gcp_projects,
     create_gcp_project,
-    HAS_GCP_TOOLS_FLAG
+    invalidate_project_cache,
+    HAS_GCP_TOOLS_FLAG,
+    _reset_caches
 )
 
 # Test data
@@ -24,6 +21,13 @@ TEST_PROJECTS = [
     {"projectId": "test-prod-1", "name": "Test Production Project"}
 ]
 
+@pytest.fixture(autouse=True)
+def reset_gcp_caches():
+    """Ensure each test builds its clients and CLI probe from the active mocks."""
+    _reset_caches()
+    yield
+    _reset_caches()
+
 @pytest.fixture
 def mock_google_auth():
     """Mock Google Auth credentials."""
@@ -163,7 +167,7 @@ class TestGCPTools:
         
         # Verify the projects list was called
         mock_subprocess.assert_any_call(
-            ["gcloud", "projects", "list", "--format=json"],
+            ["gcloud", "projects", "list", "--format=json(projectId,name)"],
             capture_output=True,
             text=True,
             check=True,
@@ -258,3 +262,185 @@ class TestGCPTools:
             if result2.get("status") == "error":
                 error_msg = result2.get("error_message", "").lower()
                 assert any(term in error_msg for term in ["project_id", "id", "invalid", "characters"])
+
+    async def test_list_projects_empty_api_falls_back_to_cli(self, mock_projects_client,
+                                                              mock_google_auth, mock_subprocess):
+        """Test that an empty API search still falls back to the gcloud CLI."""
+        mock_projects_client.return_value.search_projects.return_value = []
+        result = list_gcp_projects("all")
+        assert result["status"] == "success"
+        assert "test-stg-1" in result["report"]
+        assert any(call.args[0][:3] == ["gcloud", "projects", "list"]
+                   for call in mock_subprocess.call_args_list)
+
+    async def test_create_project_polls_operation(self, mock_projects_client, mock_google_auth):
+        """Test that project creation polls the operation until it is done."""
+        mock_operation = MagicMock(spec=operation.Operation)
+        mock_operation.done.side_effect = [False, True]
+        mock_operation.result.return_value = None
+        mock_projects_client.return_value.create_project.return_value = mock_operation
+
+        with patch("adk_cli_agent.tools.gcp_tools.time.sleep") as mock_sleep:
+            result = create_gcp_project(project_id="test-project-1")
+
+        assert result["status"] == "success"
+        assert "via API" in result["report"]
+        assert mock_operation.done.call_count == 2
+        mock_sleep.assert_called_once()
+
+    async def test_listing_during_create_not_reused(self, mock_projects_client, mock_google_auth):
+        """Test that a listing cached while a create is in flight is dropped afterwards."""
+        def list_then_finish():
+            list_gcp_projects("dev")
+            return True
+
+        mock_operation = MagicMock(spec=operation.Operation)
+        mock_operation.done.side_effect = list_then_finish
+        mock_operation.result.return_value = None
+        mock_projects_client.return_value.create_project.return_value = mock_operation
+
+        create_gcp_project(project_id="test-project-1")
+        list_gcp_projects("dev")
+        assert mock_projects_client.return_value.search_projects.call_count == 2
+
+    async def test_list_projects_retries_transient_errors(self, mock_projects_client, mock_google_auth):
+        """Test that transient API errors are retried before falling back."""
+        from google.api_core import exceptions as api_exceptions
+        mock_project = MagicMock()
+        mock_project.project_id = "test-dev-1"
+        mock_project.display_name = "Test Dev Project"
+        mock_projects_client.return_value.search_projects.side_effect = [
+            api_exceptions.ServiceUnavailable("try again"),
+            [mock_project]
+        ]
+
+        with patch("adk_cli_agent.tools.gcp_tools.time.sleep") as mock_sleep:
+            result = list_gcp_projects("all")
+
+        assert result["status"] == "success"
+        assert "Test Dev Project" in result["report"]
+        assert mock_projects_client.return_value.search_projects.call_count == 2
+        mock_sleep.assert_called_once()
+
+    async def test_create_project_not_resent_after_deadline(self, mock_projects_client,
+                                                             mock_google_auth, mock_subprocess):
+        """Test that a timed-out create is not sent again, since it may have succeeded."""
+        from google.api_core import exceptions as api_exceptions
+        create_project = mock_projects_client.return_value.create_project
+        create_project.side_effect = api_exceptions.DeadlineExceeded("deadline exceeded")
+
+        with patch("adk_cli_agent.tools.gcp_tools.time.sleep") as mock_sleep:
+            result = create_gcp_project(project_id="test-project-1")
+
+        assert result["status"] == "error"
+        assert create_project.call_count == 1
+        mock_sleep.assert_not_called()
+        assert not any(call.args[0][:3] == ["gcloud", "projects", "create"]
+                       for call in mock_subprocess.call_args_list)
+
+    async def test_create_project_not_resent_after_operation_timeout(self, mock_projects_client,
+                                                                     mock_google_auth,
+                                                                     mock_subprocess):
+        """Test that an operation that outlives the wait is not re-created via gcloud."""
+        with patch("adk_cli_agent.tools.gcp_tools._wait_for_operation",
+                   side_effect=TimeoutError("Operation did not complete within 120 seconds")):
+            result = create_gcp_project(project_id="test-project-1")
+
+        assert result["status"] == "error"
+        assert "may still complete" in result["error_message"]
+        assert not any(call.args[0][:3] == ["gcloud", "projects", "create"]
+                       for call in mock_subprocess.call_args_list)
+
+    async def test_projects_client_is_reused(self, mock_projects_client, mock_google_auth):
+        """Test that credentials and the projects client are created once."""
+        list_gcp_projects("all")
+        list_gcp_projects("dev")
+        assert mock_projects_client.call_count == 1
+        assert mock_google_auth.call_count == 1
+
+    async def test_gcloud_probe_runs_once(self, mock_projects_client, mock_google_auth, mock_subprocess):
+        """Test that the gcloud version probe is not repeated for every fallback."""
+        mock_projects_client.return_value.search_projects.side_effect = Exception("API Error")
+        list_gcp_projects("all")
+        list_gcp_projects("dev")
+        version_calls = [c for c in mock_subprocess.call_args_list if c.args[0] == ["gcloud", "--version"]]
+        assert len(version_calls) == 1
+
+    async def test_gcloud_probe_retried_after_timeout(self, mock_projects_client,
+                                                      mock_google_auth, mock_subprocess):
+        """Test that a timed-out gcloud probe is not remembered as a failure."""
+        mock_projects_client.return_value.search_projects.side_effect = Exception("API Error")
+        cli_result = mock_subprocess.return_value
+        mock_subprocess.side_effect = [subprocess.TimeoutExpired(["gcloud", "--version"], 5),
+                                       cli_result, cli_result]
+        first = list_gcp_projects("all")
+        second = list_gcp_projects("all")
+        assert "Using mock data" in first["report"]
+        assert "test-stg-1" in second["report"]
+        version_calls = [c for c in mock_subprocess.call_args_list if c.args[0] == ["gcloud", "--version"]]
+        assert len(version_calls) == 2
+
+    async def test_api_skipped_after_credentials_failure(self, mock_projects_client):
+        """Test that the API path is skipped while the circuit breaker is open."""
+        import google.auth.exceptions
+        with patch("google.auth.default",
+                   side_effect=google.auth.exceptions.DefaultCredentialsError("No credentials")) as mock_auth:
+            with patch("subprocess.run", side_effect=Exception("CLI Error")):
+                list_gcp_projects("all")
+                result = list_gcp_projects("all")
+        assert result["status"] == "success"
+        assert mock_auth.call_count == 1
+
+    async def test_create_permission_failure_keeps_list_api(self, mock_projects_client,
+                                                            mock_google_auth, mock_subprocess):
+        """Test that a permission failure on create only opens the breaker for create."""
+        from google.api_core import exceptions as api_exceptions
+        client = mock_projects_client.return_value
+        client.create_project.side_effect = api_exceptions.PermissionDenied("denied")
+        create_gcp_project(project_id="test-project-1")
+        create_gcp_project(project_id="test-project-2")
+        result = list_gcp_projects("dev")
+        assert client.create_project.call_count == 1
+        assert client.search_projects.call_count == 1
+        assert "test-dev-1" in result["report"]
+
+    async def test_list_projects_cached_until_create(self, mock_projects_client, mock_google_auth):
+        """Test that repeated listings are cached and invalidated by project creation."""
+        search_projects = mock_projects_client.return_value.search_projects
+        first = list_gcp_projects("all")
+        second = list_gcp_projects("all")
+        assert first == second
+        assert search_projects.call_count == 1
+
+        create_gcp_project(project_id="test-project-1")
+        list_gcp_projects("all")
+        assert search_projects.call_count == 2
+
+    async def test_invalidate_project_cache_single_env(self, mock_projects_client, mock_google_auth):
+        """Test that invalidating one env only drops that env's cached listing."""
+        search_projects = mock_projects_client.return_value.search_projects
+        list_gcp_projects("dev")
+        list_gcp_projects("all")
+        invalidate_project_cache("DEV")
+        list_gcp_projects("dev")
+        list_gcp_projects("all")
+        assert search_projects.call_count == 3
+
+    async def test_list_cache_evicts_least_recently_used(self, mock_projects_client,
+                                                         mock_google_auth):
+        """Test that the listing cache keeps only the most recently used env filters."""
+        search_projects = mock_projects_client.return_value.search_projects
+        mock_project = MagicMock()
+        mock_project.project_id = "test-dev-stg-prod"
+        mock_project.display_name = "Shared Project"
+        search_projects.return_value = [mock_project]
+        with patch("adk_cli_agent.tools.gcp_tools.LIST_CACHE_MAX_ENTRIES", 2):
+            list_gcp_projects("dev")
+            list_gcp_projects("stg")
+            list_gcp_projects("dev")
+            list_gcp_projects("prod")  # evicts "stg"
+            assert search_projects.call_count == 3
+            list_gcp_projects("dev")
+            assert search_projects.call_count == 3
+            list_gcp_projects("stg")
+            assert search_projects.call_count == 4
@@ -1,6 +1,8 @@
 """Simplified tests for time_tools module."""
+import datetime
 import pytest
-from adk_cli_agent.tools.time_tools import get_current_time
+from zoneinfo import ZoneInfo
+from adk_cli_agent.tools.time_tools import get_current_time, _format_time
 
 class TestTimeToolsSimple:
     """Simplified test cases for time_tools module."""
@@ -23,3 +25,9 @@ class TestTimeToolsSimple:
         supported_cities = ["new york", "paris", "jakarta", "tokyo", "london", "sydney"]
         for city in supported_cities:
             assert city in result["error_message"].lower()
+
+    def test_format_time_matches_strftime(self):
+        """Test that the fast formatter matches strftime for positive and negative offsets."""
+        for zone in ["Asia/Tokyo", "America/New_York", "Asia/Kolkata", "UTC"]:
+            moment = datetime.datetime(2024, 7, 1, 9, 5, 3, tzinfo=ZoneInfo(zone))
+            assert _format_time(moment) == moment.strftime("%H:%M:%S %Z%z")
@@ -68,6 +68,7 @@ class TestGeminiProvider:
         response2 = await provider.send_message("Second message")
         assert response2 == "Test response"
         
-        # Verify only one chat session was created
+        # Verify only one model and chat session were created
+        mock_genai.GenerativeModel.assert_called_once()
         mock_genai.GenerativeModel.return_value.start_chat.assert_called_once()
         assert provider.chat_session.send_message_async.await_count == 2
@@ -46,6 +46,25 @@ class TestDirectAPIAgent:
             result = agent.create_gcp_project("test-project-2", "Test Project")
             assert isinstance(result, ToolResult)
 
+    def test_process_command_runs_command_tool(self):
+        """Test that a response naming the command tool executes the command."""
+        provider = Mock()
+        provider.send_message.return_value = "Use the command tool"
+        with patch("my_cli_agent.tools.command_tools.execute_command",
+                   return_value=ToolResult(success=True, result="ok")) as mock_execute:
+            agent = Agent(model_provider=provider)
+            result = agent.process_command("ls")
+        mock_execute.assert_called_once_with("ls")
+        assert result == "Tool execution result: ok"
+
+    def test_process_command_skips_tools_without_commands(self):
+        """Test that tools that cannot execute commands are not dispatched to."""
+        provider = Mock()
+        provider.send_message.return_value = "It is time for lunch"
+        agent = Agent(model_provider=provider)
+        assert "time" not in agent.command_handlers
+        assert agent.process_command("when is lunch?") == "It is time for lunch"
+
 @pytest.mark.asyncio
 class TestAsyncMethods:
     @pytest.fixture
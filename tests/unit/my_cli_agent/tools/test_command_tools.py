@@ -48,10 +48,10 @@ class TestCommandTools:
         """Test handling a failed command execution."""
         # Arrange
         command = "invalid_command"
-        error_msg = b"Command not found"
+        error_msg = "Command not found"
         mock_process = MagicMock()
         mock_process.returncode = 1
-        mock_process.stdout = b""
+        mock_process.stdout = ""
         mock_process.stderr = error_msg
         mock_subprocess.run.return_value = mock_process
 
@@ -8,7 +8,8 @@ from my_cli_agent.tools.gcp_tools import (
     list_gcp_projects,
     create_gcp_project,
     delete_gcp_project,
-    HAS_GCP_TOOLS
+    HAS_GCP_TOOLS,
+    _get_projects_client
 )
 from my_cli_agent.tools.base import ToolResult
 
@@ -255,3 +256,15 @@ class TestGCPTools:
         assert isinstance(result3, ToolResult)
         assert result3.success is False
         assert "invalid organization id" in result3.error_message.lower()
+
+    def test_projects_client_is_shared(self, mock_credentials, mock_projects_client):
+        """Test that the Resource Manager client is built once and then reused."""
+        _get_projects_client.cache_clear()
+        try:
+            first = _get_projects_client()
+            second = _get_projects_client()
+            assert first is second
+            assert mock_projects_client.call_count == 1
+            assert mock_credentials.call_count == 1
+        finally:
+            _get_projects_client.cache_clear()